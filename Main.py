@@ -1,17 +1,24 @@
 import streamlit as st
 import sqlite3
 from datetime import datetime
+import functools
 import hashlib
+import json
 import magic
 from pathlib import Path
 import re
 import os
-import shutil
+import tempfile
+import threading
 
 # Local storage setup
 STORAGE_PATH = "document_storage"
 Path(STORAGE_PATH).mkdir(exist_ok=True)
 DB_PATH = "documents.db"
+CHUNK_SIZE = 1 << 20
+
+# Shared MIME detector; constructing one loads the libmagic database
+MIME = magic.Magic(mime=True)
 
 # Custom CSS for Notion-style UI
 notion_css = """
@@ -63,13 +70,46 @@ tr:hover {
 """
 st.markdown(notion_css, unsafe_allow_html=True)
 
-# Initialize database
-def init_db():
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
+# Shared database connection, opened once per server process
+@st.cache_resource
+def get_conn():
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None, cached_statements=128)
+    conn.row_factory = sqlite3.Row
+    # WAL lets readers run alongside the writer and needs fewer fsyncs per commit;
+    # mmap serves page reads straight from the OS page cache
+    conn.executescript("""
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA mmap_size=268435456;
+        PRAGMA cache_size=-65536;
+    """)
+    return conn
+
+# Lock serializing every use of the shared connection across sessions and threads;
+# reentrant so helpers that hold it can call each other
+@st.cache_resource
+def get_db_lock():
+    return threading.RLock()
+
+# Create or migrate the schema
+def create_schema(cursor):
+    # Databases created before integer ids keep their rows under legacy_* while the tables are rebuilt
+    cursor.execute("SELECT type FROM pragma_table_info('Documents') WHERE name = 'document_id'")
+    row = cursor.fetchone()
+    legacy = row is not None and row["type"].upper() == "TEXT"
+    if legacy:
+        cursor.execute("BEGIN")
+        for name in ("documents_fts_ai", "documents_fts_ad", "documents_fts_au"):
+            cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+        for name in ("idx_tags_tag", "idx_files_docid", "idx_files_mime", "idx_docs_arch_date"):
+            cursor.execute(f"DROP INDEX IF EXISTS {name}")
+        cursor.execute("DROP TABLE IF EXISTS documents_fts")
+        for name in ("Documents", "Files", "Tags"):
+            cursor.execute(f"ALTER TABLE {name} RENAME TO legacy_{name.lower()}")
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS Documents (
-            document_id TEXT PRIMARY KEY,
+            document_id INTEGER PRIMARY KEY AUTOINCREMENT,
             title TEXT,
             notes TEXT,
             created_at TIMESTAMP,
@@ -79,7 +119,7 @@ def init_db():
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS Files (
             file_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            document_id TEXT,
+            document_id INTEGER,
             filename TEXT,
             filesize INTEGER,
             mimetype TEXT,
@@ -90,131 +130,355 @@ def init_db():
     """)
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS Tags (
-            document_id TEXT,
+            document_id INTEGER,
             tag TEXT,
             PRIMARY KEY (document_id, tag),
             FOREIGN KEY (document_id) REFERENCES Documents (document_id)
         )
     """)
-    conn.commit()
-    conn.close()
+    if legacy:
+        # The old implicit rowid becomes the new document_id
+        cursor.execute("""
+            INSERT INTO Documents (document_id, title, notes, created_at, archived)
+            SELECT rowid, title, notes, created_at, archived FROM legacy_documents
+        """)
+        cursor.execute("""
+            INSERT INTO Files (file_id, document_id, filename, filesize, mimetype, sha256, local_path)
+            SELECT f.file_id, d.rowid, f.filename, f.filesize, f.mimetype, f.sha256, f.local_path
+            FROM legacy_files f JOIN legacy_documents d ON d.document_id = f.document_id
+        """)
+        cursor.execute("""
+            INSERT INTO Tags (document_id, tag)
+            SELECT d.rowid, t.tag
+            FROM legacy_tags t JOIN legacy_documents d ON d.document_id = t.document_id
+        """)
+        for name in ("legacy_tags", "legacy_files", "legacy_documents"):
+            cursor.execute(f"DROP TABLE {name}")
+        cursor.execute("COMMIT")
+    # Full-text index over title+notes, kept in sync with Documents by triggers
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'documents_fts'")
+    fts_exists = cursor.fetchone() is not None
+    cursor.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+            title,
+            notes,
+            content='Documents',
+            content_rowid='rowid',
+            tokenize='trigram'
+        )
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS documents_fts_ai AFTER INSERT ON Documents BEGIN
+            INSERT INTO documents_fts (rowid, title, notes) VALUES (new.rowid, new.title, new.notes);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS documents_fts_ad AFTER DELETE ON Documents BEGIN
+            INSERT INTO documents_fts (documents_fts, rowid, title, notes) VALUES ('delete', old.rowid, old.title, old.notes);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS documents_fts_au AFTER UPDATE OF title, notes ON Documents BEGIN
+            INSERT INTO documents_fts (documents_fts, rowid, title, notes) VALUES ('delete', old.rowid, old.title, old.notes);
+            INSERT INTO documents_fts (rowid, title, notes) VALUES (new.rowid, new.title, new.notes);
+        END
+    """)
+    if not fts_exists:
+        # Index documents stored before the FTS table existed
+        cursor.execute("INSERT INTO documents_fts (documents_fts) VALUES ('rebuild')")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_tags_tag ON Tags (tag)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_files_docid ON Files (document_id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_files_mime ON Files (mimetype)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_docs_arch_date ON Documents (archived, created_at DESC)")
+    # Planner statistics: full ANALYZE the first time, then only when SQLite thinks it's stale
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'")
+    if cursor.fetchone() is None:
+        cursor.execute("ANALYZE")
+    else:
+        cursor.execute("PRAGMA optimize")
+
+# Initialize database
+def init_db():
+    with get_db_lock():
+        conn = get_conn()
+        cursor = conn.cursor()
+        try:
+            create_schema(cursor)
+        except BaseException:
+            # A failed legacy migration must not leave the shared connection mid-transaction
+            if conn.in_transaction:
+                cursor.execute("ROLLBACK")
+            raise
 
 # Compute SHA256
 def compute_sha256(file):
+    pos = file.tell()
+    if hasattr(hashlib, "file_digest") and hasattr(file, "readinto"):
+        # Hash loop runs in C (and uses SHA-NI where OpenSSL supports it)
+        digest = hashlib.file_digest(file, "sha256").hexdigest()
+    else:
+        sha256 = hashlib.sha256()
+        for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+            sha256.update(chunk)
+        digest = sha256.hexdigest()
+    file.seek(pos)
+    return digest
+
+# Copy an upload into an open file, returning (sha256, filesize, head)
+def copy_upload(file, f):
+    if hasattr(file, "getbuffer"):
+        # In-memory uploads (Streamlit's UploadedFile): write and hash the buffer directly
+        with file.getbuffer() as buf:
+            data = buf[file.tell():]
+            f.write(data)
+            sha256 = hashlib.sha256(data).hexdigest()
+            filesize = len(data)
+            head = bytes(data[:1024])
+            data.release()
+        return sha256, filesize, head
+    try:
+        src_fd = file.fileno() if file.seekable() else None
+    except (AttributeError, OSError, ValueError):
+        src_fd = None
+    if src_fd is not None and hasattr(os, "sendfile"):
+        # Seekable file-backed uploads: hash in C, then let the kernel copy the bytes
+        start = file.tell()
+        try:
+            sha256 = compute_sha256(file)
+            head = file.read(1024)
+            end = os.fstat(src_fd).st_size
+            f.flush()
+            offset = start
+            while offset < end:
+                sent = os.sendfile(f.fileno(), src_fd, offset, end - offset)
+                if sent == 0:
+                    break
+                offset += sent
+            return sha256, offset - start, head
+        except OSError:
+            # sendfile may not support this pair of files (e.g. macOS); copy in Python instead
+            file.seek(start)
+            f.seek(0)
+            f.truncate()
+    # Anything else: single pass, writing while hashing, sizing and capturing the MIME header
     sha256 = hashlib.sha256()
-    for chunk in iter(lambda: file.read(4096), b""):
+    filesize = 0
+    head = b""
+    for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+        f.write(chunk)
         sha256.update(chunk)
-    file.seek(0)
-    return sha256.hexdigest()
+        filesize += len(chunk)
+        if len(head) < 1024:
+            head += chunk[:1024 - len(head)]
+    return sha256.hexdigest(), filesize, head
+
+# Stream an upload into content-addressed storage; identical bytes are stored once
+def store_file(file):
+    tmp_dir = os.path.join(STORAGE_PATH, "tmp")
+    os.makedirs(tmp_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=tmp_dir)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            sha256, filesize, head = copy_upload(file, f)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    local_path = os.path.join(STORAGE_PATH, sha256[:2], sha256)
+    if os.path.exists(local_path):
+        os.remove(tmp_path)
+    else:
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        os.replace(tmp_path, local_path)
+    return filesize, MIME.from_buffer(head), sha256, local_path
 
 # Add document
 def add_document(title, notes, tags, files):
-    document_id = hashlib.md5(f"{title}{datetime.now()}".encode()).hexdigest()
     created_at = datetime.now()
     tags = [tag.strip() for tag in tags.split(",")] if tags else []
+    stored = [(file.name, *store_file(file)) for file in files]
 
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    cursor.execute(
-        "INSERT INTO Documents (document_id, title, notes, created_at, archived) VALUES (?, ?, ?, ?, ?)",
-        (document_id, title, notes, created_at, False)
-    )
-
-    mime = magic.Magic(mime=True)
-    for file in files:
-        filename = file.name
-        sha256 = compute_sha256(file)
-        filesize = len(file.read())
-        file.seek(0)
-        mimetype = mime.from_buffer(file.read(1024))
-        file.seek(0)
-        local_path = os.path.join(STORAGE_PATH, f"{document_id}_{filename}")
-        with open(local_path, "wb") as f:
-            shutil.copyfileobj(file, f)
+    # All rows for the document are committed together in one transaction
+    conn = get_conn()
+    with get_db_lock(), conn:
+        cursor = conn.cursor()
+        cursor.execute("BEGIN")
         cursor.execute(
+            "INSERT INTO Documents (title, notes, created_at, archived) VALUES (?, ?, ?, ?)",
+            (title, notes, created_at, False)
+        )
+        document_id = cursor.lastrowid
+        cursor.executemany(
             "INSERT INTO Files (document_id, filename, filesize, mimetype, sha256, local_path) VALUES (?, ?, ?, ?, ?, ?)",
-            (document_id, filename, filesize, mimetype, sha256, local_path)
+            [(document_id, *row) for row in stored]
+        )
+        cursor.executemany(
+            "INSERT OR IGNORE INTO Tags (document_id, tag) VALUES (?, ?)",
+            [(document_id, tag) for tag in tags if tag]
         )
-    for tag in tags:
-        if tag:
-            cursor.execute("INSERT OR IGNORE INTO Tags (document_id, tag) VALUES (?, ?)", (document_id, tag))
-    conn.commit()
-    conn.close()
+    cached_search.clear()
     return document_id
 
+# Search query tokens: filter prefix, -exclude, AND/OR operator, or a free term
+TOKEN_RE = re.compile(r'(tag|year|mime):(\S+)|-(\S+)|(AND|OR)(?!\S)|(\S+)')
+
+# Quote a term for an FTS5 MATCH expression
+def fts_quote(term):
+    return '"' + term.replace('"', '""') + '"'
+
+# The trigram tokenizer cannot match anything shorter than this; such terms use LIKE
+FTS_MIN_TERM = 3
+
 # Parse search query (fixed syntax)
-def parse_search_query(query):
-    conditions = []
-    params = []
+def parse_search_query(query, include_archived=True):
+    terms = []
     tags = []
     years = []
     mimes = []
     excludes = []
 
-    tokens = re.split(r'\s+', query.strip())
-    i = 0
-    while i < len(tokens):
-        token = tokens[i]
-        if token.startswith("tag:"):
-            tags.append(token[4:])
-        elif token.startswith("year:"):
-            years.append(token[5:])
-        elif token.startswith("mime:"):
-            mimes.append(token[5:])
-        elif token.startswith("-"):
-            excludes.append(token[1:])
-        elif token in ("AND", "OR"):
-            conditions.append(token)
+    filters = {"tag": tags, "year": years, "mime": mimes}
+    for m in TOKEN_RE.finditer(query):
+        prefix, value, exclude, operator, term = m.groups()
+        if prefix:
+            filters[prefix].append(value)
+        elif exclude:
+            excludes.append(exclude)
+        elif operator:
+            # Operators only make sense between two terms
+            if terms and terms[-1] not in ("AND", "OR"):
+                terms.append(operator)
         else:
-            conditions.append("(d.title LIKE ? OR d.notes LIKE ?)")
-            params.extend([f"%{token}%", f"%{token}%"])
-        i += 1
-
-    sql = """
-        SELECT d.document_id, d.title, d.notes, d.created_at, d.archived, 
-               group_concat(t.tag) as tags, 
-               group_concat(f.filename) as files, 
-               group_concat(f.local_path) as local_paths
-        FROM Documents d 
-        LEFT JOIN Tags t ON d.document_id = t.document_id 
-        LEFT JOIN Files f ON d.document_id = f.document_id
-        WHERE 1=1
-    """
-    if tags:
-        sql += " AND d.document_id IN (SELECT document_id FROM Tags WHERE " + " OR ".join(["tag = ?" for _ in tags]) + ")"
-        params.extend(tags)
-    if years:
-        sql += " AND (" + " OR ".join(["strftime('%Y', d.created_at) = ?" for _ in years]) + ")"
-        params.extend(years)
-    if mimes:
-        sql += " AND d.document_id IN (SELECT document_id FROM Files WHERE " + " OR ".join(["mimetype LIKE ?" for _ in mimes]) + ")"
-        params.extend([f"%{m}%" for m in mimes])
-    if excludes:
-        sql += " AND (d.title NOT LIKE ? AND d.notes NOT LIKE ?)"
-        params.extend([f"%{ex}%" for ex in excludes] * 2)
-    if conditions:
-        sql += " AND " + " ".join(conditions)
-    sql += " GROUP BY d.document_id ORDER BY d.created_at DESC"
+            terms.append(term)
+    while terms and terms[-1] in ("AND", "OR"):
+        terms.pop()
+    long_excludes = [ex for ex in excludes if len(ex) >= FTS_MIN_TERM]
+    short_excludes = [ex for ex in excludes if len(ex) < FTS_MIN_TERM]
+
+    params = []
+    term_shape = ()
+    if all(len(t) >= FTS_MIN_TERM for t in terms):
+        # One MATCH expression covers every term
+        if terms:
+            params.append(" ".join(t if t in ("AND", "OR") else fts_quote(t) for t in terms))
+    else:
+        # Short terms need LIKE, so each term becomes its own predicate
+        shape = []
+        for t in terms:
+            if t in ("AND", "OR"):
+                shape.append(t)
+                continue
+            if shape and shape[-1] not in ("AND", "OR"):
+                shape.append("AND")
+            if len(t) >= FTS_MIN_TERM:
+                shape.append("fts")
+                params.append(fts_quote(t))
+            else:
+                shape.append("like")
+                params.extend([f"%{t}%", f"%{t}%"])
+        term_shape = tuple(shape)
+    params.extend(tags)
+    params.extend(years)
+    params.extend([f"%{m}%" for m in mimes])
+    if long_excludes:
+        params.append(" OR ".join(fts_quote(ex) for ex in long_excludes))
+    for ex in short_excludes:
+        params.extend([f"%{ex}%", f"%{ex}%"])
+    sql = build_search_sql(
+        bool(terms) and not term_shape, term_shape, len(tags), len(years), len(mimes),
+        bool(long_excludes), len(short_excludes), include_archived
+    )
     return sql, params
 
-# Search documents
-def search_documents(query=""):
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-    sql, params = parse_search_query(query)
-    cursor.execute(sql, params)
-    results = [dict(row) for row in cursor.fetchall()]
-    conn.close()
+# SQL for one query shape; identical text lets sqlite3 reuse its compiled statement
+@functools.lru_cache(maxsize=64)
+def build_search_sql(has_terms, term_shape, n_tags, n_years, n_mimes, has_excludes, n_short_excludes, include_archived):
+    # Free-text terms run first against the FTS index, then filters apply to the matches
+    if has_terms:
+        sql = """
+            WITH fts AS (SELECT rowid FROM documents_fts WHERE documents_fts MATCH ?)
+            SELECT d.document_id, d.title, d.notes, d.created_at, d.archived
+            FROM fts
+            JOIN Documents d ON d.rowid = fts.rowid
+            WHERE 1=1
+        """
+    else:
+        sql = """
+            SELECT d.document_id, d.title, d.notes, d.created_at, d.archived
+            FROM Documents d
+            WHERE 1=1
+        """
+    if term_shape:
+        predicates = {
+            "fts": "d.rowid IN (SELECT rowid FROM documents_fts WHERE documents_fts MATCH ?)",
+            "like": "(d.title LIKE ? OR d.notes LIKE ?)",
+            "AND": "AND",
+            "OR": "OR",
+        }
+        sql += " AND (" + " ".join(predicates[part] for part in term_shape) + ")"
+    if n_tags:
+        sql += " AND d.document_id IN (SELECT document_id FROM Tags WHERE " + " OR ".join(["tag = ?"] * n_tags) + ")"
+    if n_years:
+        sql += " AND (" + " OR ".join(["strftime('%Y', d.created_at) = ?"] * n_years) + ")"
+    if n_mimes:
+        sql += " AND d.document_id IN (SELECT document_id FROM Files WHERE " + " OR ".join(["mimetype LIKE ?"] * n_mimes) + ")"
+    if not include_archived:
+        sql += " AND d.archived = 0"
+    if has_excludes:
+        sql += " AND d.rowid NOT IN (SELECT rowid FROM documents_fts WHERE documents_fts MATCH ?)"
+    # ifnull keeps a NULL title or notes from making the whole NOT unknown
+    sql += " AND NOT (ifnull(d.title, '') LIKE ? OR ifnull(d.notes, '') LIKE ?)" * n_short_excludes
+    sql += " ORDER BY d.created_at DESC"
+    return sql
+
+# Database version stamp; with WAL, commits land in the -wal file first
+def db_mtime():
+    paths = [DB_PATH, DB_PATH + "-wal"]
+    return max((os.stat(p).st_mtime_ns for p in paths if os.path.exists(p)), default=0)
+
+# Search documents (results cached per query and database version)
+def search_documents(query="", include_archived=True):
+    return cached_search(query, include_archived, db_mtime())
+
+@st.cache_data(ttl=30, max_entries=128)
+def cached_search(query, include_archived, db_mtime):
+    with get_db_lock():
+        cursor = get_conn().cursor()
+        sql, params = parse_search_query(query, include_archived)
+        cursor.execute(sql, params)
+        results = [dict(row) for row in cursor.fetchall()]
+        # Fetch tags and files for all matched documents in one query each,
+        # rather than joining both into the search and multiplying rows
+        by_id = {}
+        for result in results:
+            result.update(tags=[], files=[], local_paths=[])
+            by_id[result["document_id"]] = result
+        ids = json.dumps(list(by_id))
+        cursor.execute("SELECT document_id, tag FROM Tags WHERE document_id IN (SELECT value FROM json_each(?))", (ids,))
+        for row in cursor.fetchall():
+            by_id[row["document_id"]]["tags"].append(row["tag"])
+        cursor.execute(
+            "SELECT document_id, filename, local_path FROM Files WHERE document_id IN (SELECT value FROM json_each(?)) ORDER BY file_id",
+            (ids,)
+        )
+        for row in cursor.fetchall():
+            by_id[row["document_id"]]["files"].append(row["filename"])
+            by_id[row["document_id"]]["local_paths"].append(row["local_path"])
     return results
 
 # Archive/unarchive document
 def toggle_archive(document_id, archive=True):
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    cursor.execute("UPDATE Documents SET archived = ? WHERE document_id = ?", (1 if archive else 0, document_id))
-    conn.commit()
-    conn.close()
+    with get_db_lock():
+        cursor = get_conn().cursor()
+        cursor.execute("UPDATE Documents SET archived = ? WHERE document_id = ?", (1 if archive else 0, document_id))
+    cached_search.clear()
+
+# Read a stored file for download; keyed on mtime so replaced files are re-read
+@st.cache_resource(max_entries=32)
+def load_file(path, mtime):
+    return Path(path).read_bytes()
+
+# Initialize DB before any page queries it
+init_db()
 
 # Streamlit app
 st.title("DocStore")
@@ -255,19 +519,18 @@ elif page == "Documents":
     st.header("Documents")
     query = st.text_input("Search", placeholder="e.g., tag:work year:2023 -draft")
     show_archived = st.checkbox("Show archived documents")
-    results = search_documents(query)
-    if not show_archived:
-        results = [r for r in results if not r["archived"]]
+    results = search_documents(query, include_archived=show_archived)
     if results:
         for result in results:
             with st.expander(f"{result['title']} ({result['created_at'].strftime('%Y-%m-%d')})"):
                 st.write(f"**Notes**: {result['notes'] or 'None'}")
-                st.write(f"**Tags**: {result['tags'] or 'None'}")
-                files = result["files"].split(",") if result["files"] else []
-                local_paths = result["local_paths"].split(",") if result["local_paths"] else []
-                for file, path in zip(files, local_paths):
-                    with open(path, "rb") as f:
-                        st.download_button(f"Download {file}", f, file_name=file)
+                st.write(f"**Tags**: {', '.join(result['tags']) or 'None'}")
+                for i, (file, path) in enumerate(zip(result["files"], result["local_paths"])):
+                    # File bytes are only loaded once the user asks for this download
+                    key = f"download_{result['document_id']}_{i}"
+                    if st.session_state.get(key) or st.button(f"Prepare {file}", key=f"prepare_{key}"):
+                        st.session_state[key] = True
+                        st.download_button(f"Download {file}", load_file(path, os.path.getmtime(path)), file_name=file)
                 col1, col2 = st.columns(2)
                 with col1:
                     if st.button("Archive" if not result["archived"] else "Unarchive", key=f"toggle_{result['document_id']}"):
@@ -282,15 +545,12 @@ elif page == "Documents":
 # Tags Page
 elif page == "Tags":
     st.header("Tags")
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    cursor.execute("SELECT tag, COUNT(*) as count FROM Tags GROUP BY tag")
-    tags = cursor.fetchall()
-    conn.close()
+    with get_db_lock():
+        cursor = get_conn().cursor()
+        cursor.execute("SELECT tag, COUNT(*) as count FROM Tags GROUP BY tag")
+        tags = cursor.fetchall()
     if tags:
         st.table({"Tag": [t[0] for t in tags], "Documents": [t[1] for t in tags]})
     else:
         st.write("No tags found.")
 
-# Initialize DB
-init_db()